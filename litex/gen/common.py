@@ -6,6 +6,7 @@ def reverse_bits(s):
 
 
 def reverse_bytes(s):
-    n = (len(s) + 7)//8
-    return Cat(*[s[i*8:min((i + 1)*8, len(s))]
+    length = len(s)
+    n = (length + 7)//8
+    return Cat(*[s[i*8:min((i + 1)*8, length)]
         for i in reversed(range(n))])
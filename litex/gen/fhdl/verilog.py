@@ -1,6 +1,6 @@
-from functools import partial
 from operator import itemgetter
 import collections
+import collections.abc
 
 from migen.fhdl.structure import *
 from migen.fhdl.structure import _Operator, _Slice, _Assign, _Fragment
@@ -38,8 +38,8 @@ def _printsig(ns, s):
         n = "signed "
     else:
         n = ""
-    if len(s) > 1:
-        n += "[" + str(len(s)-1) + ":0] "
+    if s.nbits > 1:
+        n += "[" + str(s.nbits-1) + ":0] "
     n += ns.get_name(s)
     return n
 
@@ -130,7 +130,7 @@ def _printnode(ns, at, level, node, target_filter=None):
         else:
             assignment = " <= "
         return "\t"*level + _printexpr(ns, node.l)[0] + assignment + _printexpr(ns, node.r)[0] + ";\n"
-    elif isinstance(node, collections.Iterable):
+    elif isinstance(node, collections.abc.Iterable):
         return "".join(_printnode(ns, at, level, n, target_filter) for n in node)
     elif isinstance(node, If):
         r = "\t"*level + "if (" + _printexpr(ns, node.cond)[0] + ") begin\n"
@@ -266,17 +266,12 @@ def _printcomb_simulation(f, ns,
             r += "initial " + ns.get_name(dummy_s) + " <= 1'd0;\n"
             r += syn_on
 
-
-        from collections import defaultdict
-
-        target_stmt_map = defaultdict(list)
+        target_stmt_map = dict()
 
         for statement in flat_iteration(f.comb):
             targets = list_targets(statement)
             for t in targets:
-                target_stmt_map[t].append(statement)
-
-        groups = group_by_targets(f.comb)
+                target_stmt_map.setdefault(t, []).append(statement)
 
         for n, (t, stmts) in enumerate(target_stmt_map.items()):
             assert isinstance(t, Signal)
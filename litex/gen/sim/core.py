@@ -1,5 +1,6 @@
 import operator
 import collections
+import collections.abc
 import inspect
 from functools import wraps
 
@@ -19,6 +20,8 @@ from litex.gen.sim.vcd import VCDWriter, DummyVCDWriter
 
 
 class ClockState:
+    __slots__ = ("high", "half_period", "time_before_trans")
+
     def __init__(self, high, half_period, time_before_trans):
         self.high = high
         self.half_period = half_period
@@ -95,6 +98,7 @@ class Evaluator:
         self.replaced_memories = replaced_memories
         self.signal_values = dict()
         self.modifications = dict()
+        self.case_tables = dict()
 
     def commit(self):
         r = set()
@@ -119,20 +123,22 @@ class Evaluator:
             except KeyError:
                 return node.reset.value
         elif isinstance(node, _Operator):
+            op = node.op
+            if op == "m":
+                # only evaluate the selected operand
+                sel, a, b = node.operands
+                return self.eval(a if self.eval(sel, postcommit) else b, postcommit)
             operands = [self.eval(o, postcommit) for o in node.operands]
-            if node.op == "-":
+            if op == "-":
                 if len(operands) == 1:
                     return -operands[0]
                 else:
                     return operands[0] - operands[1]
-            elif node.op == "m":
-                return operands[1] if operands[0] else operands[2]
             else:
-                return str2op[node.op](*operands)
+                return str2op[op](*operands)
         elif isinstance(node, _Slice):
             v = self.eval(node.value, postcommit)
-            idx = range(node.start, node.stop)
-            return sum(((v >> i) & 1) << j for j, i in enumerate(idx))
+            return (v >> node.start) & ((1 << (node.stop - node.start)) - 1)
         elif isinstance(node, Cat):
             shift = 0
             r = 0
@@ -145,7 +151,10 @@ class Evaluator:
         elif isinstance(node, Replicate):
             nbits = len(node.v)
             v = self.eval(node.v, postcommit) & (2**nbits - 1)
-            return sum(v << i*nbits for i in range(node.n))
+            if nbits == 0 or node.n == 0:
+                return 0
+            # multiply by n ones spaced nbits apart
+            return v*((2**(nbits*node.n) - 1)//(2**nbits - 1))
         elif isinstance(node, _ArrayProxy):
             idx = min(len(node.choices) - 1, self.eval(node.key, postcommit))
             return self.eval(node.choices[idx], postcommit)
@@ -194,6 +203,20 @@ class Evaluator:
         else:
             raise NotImplementedError(node)
 
+    def _case_table(self, s):
+        try:
+            return self.case_tables[s]
+        except KeyError:
+            pass
+        nbits, signed = value_bits_sign(s.test)
+        choices = dict()
+        for k, v in s.cases.items():
+            if isinstance(k, Constant):
+                choices.setdefault(k.value, v)
+        table = nbits, signed, choices, s.cases.get("default")
+        self.case_tables[s] = table
+        return table
+
     def execute(self, statements):
         for s in statements:
             if isinstance(s, _Assign):
@@ -204,17 +227,12 @@ class Evaluator:
                 else:
                     self.execute(s.f)
             elif isinstance(s, Case):
-                nbits, signed = value_bits_sign(s.test)
+                nbits, signed, choices, default = self._case_table(s)
                 test = _truncate(self.eval(s.test), nbits, signed)
-                found = False
-                for k, v in s.cases.items():
-                    if isinstance(k, Constant) and k.value == test:
-                        self.execute(v)
-                        found = True
-                        break
-                if not found and "default" in s.cases:
-                    self.execute(s.cases["default"])
-            elif isinstance(s, collections.Iterable):
+                v = choices.get(test, default)
+                if v is not None:
+                    self.execute(v)
+            elif isinstance(s, collections.abc.Iterable):
                 self.execute(s)
             elif isinstance(s, Display):
                 args = []
@@ -266,7 +284,7 @@ class Simulator:
         self.generators = dict()
         self.passive_generators = set()
         for k, v in generators.items():
-            if (isinstance(v, collections.Iterable)
+            if (isinstance(v, collections.abc.Iterable)
                     and not inspect.isgenerator(v)):
                 self.generators[k] = list(v)
             else:
@@ -363,8 +381,9 @@ class Simulator:
 
     def _continue_simulation(self):
         for cd_generators in self.generators.values():
-            if set(cd_generators) - self.passive_generators:
-                return True
+            for generator in cd_generators:
+                if generator not in self.passive_generators:
+                    return True
         return False
 
     def run(self):
@@ -31,7 +31,7 @@ class VCDWriter:
         self.t = 0
 
     def _write_value(self, signal, value):
-        l = len(signal)
+        l = signal.nbits
         if value < 0:
             value += 2**l
         if l > 1:
@@ -67,7 +67,7 @@ class VCDWriter:
         ns = build_namespace(self.codes.keys())
         for signal, code in self.codes.items():
             name = ns.get_name(signal)
-            header += "$var wire {len} {code} {name} $end\n".format(name=name, code=code, len=len(signal))
+            header += "$var wire {len} {code} {name} $end\n".format(name=name, code=code, len=signal.nbits)
         header += "$dumpvars\n"
         for signal in self.codes.keys():
             header += self._write_value(signal, signal.reset.value)
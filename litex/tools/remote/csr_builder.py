@@ -77,7 +77,8 @@ class CSRBuilder:
 
     @staticmethod
     def get_csr_items(csr_csv):
-        return list(csv.reader(filter(lambda row: row[0] != "#", open(csr_csv))))
+        with open(csr_csv) as f:
+            return list(csv.reader(row for row in f if not row.startswith("#")))
 
     def build_bases(self):
         d = {}
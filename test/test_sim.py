@@ -0,0 +1,83 @@
+import unittest
+
+from migen import *
+
+from litex.gen.sim import run_simulation
+
+
+class CaseDUT(Module):
+    def __init__(self):
+        self.test = Signal((3, True))
+        self.with_default = Signal(8)
+        self.without_default = Signal(8)
+        self.out_of_range = Signal(8)
+
+        # # #
+
+        self.comb += [
+            Case(self.test, {
+                -1:        self.with_default.eq(1),
+                2:         self.with_default.eq(2),
+                "default": self.with_default.eq(3)
+            }),
+            Case(self.test, {
+                -4: self.without_default.eq(4),
+                0:  self.without_default.eq(5)
+            })
+        ]
+        # 7 is out of range for a 3-bit signed test (111 reads as -1)
+        self.comb += Case(self.test, {7: self.out_of_range.eq(6)})
+
+
+class TestSim(unittest.TestCase):
+    def test_case(self):
+        dut = CaseDUT()
+        def generator():
+            expected = {
+                -4: (3, 4, 0),
+                -1: (1, 0, 0),
+                0:  (3, 5, 0),
+                1:  (3, 0, 0),
+                2:  (2, 0, 0),
+                3:  (3, 0, 0)
+            }
+            for test, values in sorted(expected.items()):
+                yield dut.test.eq(test)
+                yield
+                self.assertEqual((yield dut.with_default), values[0])
+                self.assertEqual((yield dut.without_default), values[1])
+                self.assertEqual((yield dut.out_of_range), values[2])
+        run_simulation(dut, generator())
+
+    def test_slice_negative(self):
+        s = Signal((8, True))
+        def generator():
+            yield s.eq(-3)
+            yield
+            self.assertEqual((yield s), -3)
+            self.assertEqual((yield s[0:4]), 0b1101)
+            self.assertEqual((yield s[4:8]), 0b1111)
+            self.assertEqual((yield s[1:3]), 0b10)
+            self.assertEqual((yield s[7]), 1)
+        run_simulation(Module(), generator())
+
+    def test_mux(self):
+        sel = Signal(2)
+        a = Signal(4, reset=5)
+        b = Signal(4, reset=9)
+        def generator():
+            for i in range(4):
+                yield sel.eq(i)
+                yield
+                self.assertEqual((yield Mux(sel, a, b)), 5 if i else 9)
+        run_simulation(Module(), generator())
+
+    def test_replicate(self):
+        x = Signal(3, reset=0b101)
+        def generator():
+            self.assertEqual((yield Replicate(x, 0)), 0)
+            self.assertEqual((yield Replicate(x, 1)), 0b101)
+            self.assertEqual((yield Replicate(x, 3)), 0b101101101)
+            self.assertEqual((yield Replicate(Cat(), 3)), 0)
+            self.assertEqual((yield Replicate(Replicate(x, 0), 2)), 0)
+        run_simulation(Module(), generator())
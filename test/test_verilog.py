@@ -0,0 +1,49 @@
+import unittest
+
+from migen import *
+
+from litex.gen.fhdl import verilog
+
+
+class VerilogDUT(Module):
+    def __init__(self):
+        self.a = Signal(8, name_override="a")
+        self.b = Signal(name_override="b")
+        self.o = Signal(8, name_override="o")
+        self.p = Signal((4, True), name_override="p")
+
+        # # #
+
+        self.comb += [
+            self.o.eq(self.a + 1),
+            If(self.b,
+                self.p.eq(-1)
+            ).Else(
+                self.p.eq(self.a[:4])
+            )
+        ]
+        self.sync += self.b.eq(~self.b)
+
+
+class TestVerilog(unittest.TestCase):
+    def test_regular_comb(self):
+        dut = VerilogDUT()
+        v = str(verilog.convert(dut, ios={dut.a, dut.o}))
+        self.assertIn("\tinput [7:0] a,\n", v)
+        self.assertIn("\toutput [7:0] o,\n", v)
+        self.assertIn("reg b = 1'd0;\n", v)
+        self.assertIn("reg signed [3:0] p = ", v)
+        self.assertIn("assign o = (a + 1'd1);\n", v)
+        self.assertIn("\tif (b) begin\n", v)
+        self.assertIn("\t\tp <= a[3:0];\n", v)
+        self.assertIn("always @(posedge sys_clk) begin\n\tb <= (~b);\n", v)
+        self.assertEqual(v.count("always @(*) begin"), 1)
+
+    def test_simulation_comb(self):
+        dut = VerilogDUT()
+        v = str(verilog.convert(dut, regular_comb=False))
+        self.assertIn("reg [7:0] a = 8'd0;\n", v)
+        self.assertIn("wire [7:0] o;\n", v)
+        self.assertIn("assign o = (a + 1'd1);\n", v)
+        self.assertIn("\tdummy_d = dummy_s;\n", v)
+        self.assertEqual(v.count("always @(*) begin"), 1)